@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from enum import Enum
 import re
 
@@ -11,9 +11,20 @@ class Status(Enum):
     CRITICAL = "critical"
 
     @staticmethod
-    def worst(statuses: List["Status"]) -> "Status":
-        order = {Status.OK: 0, Status.WARN: 1, Status.CRITICAL: 2}
-        return max(statuses, key=lambda s: order.get(s, 0))
+    def worst(statuses: Iterable["Status"]) -> "Status":
+        """Worst status in the iterable; OK if empty. Short-circuits on CRITICAL."""
+        worst = Status.OK
+        for s in statuses:
+            if s is Status.CRITICAL:
+                return Status.CRITICAL
+            if s is Status.WARN:
+                worst = Status.WARN
+        return worst
+
+
+# Backreferences (\1, (?P=name)) refer to different groups once patterns are
+# concatenated into an alternation, so such patterns can't be combined.
+_BACKREF_RE = re.compile(r"\\\d|\(\?P=")
 
 
 @dataclass
@@ -43,17 +54,33 @@ class HealthCheckResult:
             merged_lines.extend(result.tooltipLines)
         
         return HealthCheckResult(
-            status=Status.worst([r.status for r in results.values()]),
+            status=Status.worst(r.status for r in results.values()),
             tooltipLines=merged_lines,
         )
 
 class HealthCheckModule(ABC):
     def __init__(self, ignore_rules: Optional[IgnoreRules] = None):
         self.ignore_rules = ignore_rules or IgnoreRules(patterns=[])
+        # Union all ignore patterns into one regex so is_ignored does a
+        # single engine pass per line instead of one per pattern. Some
+        # individually-valid patterns don't survive concatenation — global
+        # inline flags like (?i) raise re.error, and backreferences would
+        # silently renumber — so fall back to matching per pattern then.
+        patterns = self.ignore_rules.patterns
+        self._combined_ignore: Optional[re.Pattern] = None
+        if patterns and not any(_BACKREF_RE.search(p.pattern) for p in patterns):
+            try:
+                self._combined_ignore = re.compile(
+                    "|".join(f"(?:{p.pattern})" for p in patterns)
+                )
+            except re.error:
+                pass
 
     @abstractmethod
     def check(self) -> HealthCheckResult:
         pass
 
     def is_ignored(self, text: str) -> bool:
+        if self._combined_ignore is not None:
+            return self._combined_ignore.search(text) is not None
         return any(r.search(text) for r in self.ignore_rules.patterns)
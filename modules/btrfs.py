@@ -3,6 +3,8 @@ from typing import List, Optional, Tuple
 from .base import HealthCheckModule, IgnoreRules, Status, HealthCheckResult
 from .utils import run, format_command_error
 
+_DEVICE_STATS_RE = re.compile(r"^\[.+\]\.(\S+)\s+(\d+)$")
+
 
 class BtrfsModule(HealthCheckModule):
     """Health check for btrfs filesystem."""
@@ -10,13 +12,20 @@ class BtrfsModule(HealthCheckModule):
     def __init__(self, ignore_rules: Optional[IgnoreRules] = None):
         super().__init__(ignore_rules)
         self.max_tooltip_lines = 12
+        self._fstype: Optional[str] = None
 
     def detect_root_fstype(self) -> str:
-        """Detect root filesystem type."""
-        code, out, _ = run(["findmnt", "-n", "-o", "FSTYPE", "/"])
+        """Detect root filesystem type (cached; it can't change without a reboot)."""
+        if self._fstype is not None:
+            return self._fstype
+        self._fstype = self._detect_root_fstype()
+        return self._fstype
+
+    def _detect_root_fstype(self) -> str:
+        code, out, _ = run(["findmnt", "-n", "-o", "FSTYPE", "/"], want_stderr=False)
         if code == 0 and out.strip():
             return out.strip()
-        code, out, _ = run(["stat", "-f", "-c", "%T", "/"])
+        code, out, _ = run(["stat", "-f", "-c", "%T", "/"], want_stderr=False)
         if code == 0 and out.strip():
             return out.strip()
         return "unknown"
@@ -44,7 +53,12 @@ class BtrfsModule(HealthCheckModule):
                 continue
             if self.is_ignored(ln):
                 continue
-            m = re.match(r"^\[.+\]\.(\S+)\s+(\d+)$", ln)
+            # cheap substring test before paying for the regex
+            if "]." not in ln:
+                parse_err = True
+                interesting.append(f"couldn't parse this line: {ln}")
+                continue
+            m = _DEVICE_STATS_RE.match(ln)
             if m:
                 metric = m.group(1)
                 val = int(m.group(2))
@@ -63,8 +77,7 @@ class BtrfsModule(HealthCheckModule):
             status = Status.OK
 
         details = [f"non-zero counters: {nonzero}"]
-        for ln in interesting[:self.max_tooltip_lines]:
-            details.append(f"  {ln}")
+        details.extend("  " + ln for ln in interesting[:self.max_tooltip_lines])
         if nonzero == 0:
             details.append("  (none)")
 
@@ -87,17 +100,23 @@ class BtrfsModule(HealthCheckModule):
                 tooltipLines=format_command_error("btrfs scrub status", code, out, err)
             )
 
-        lines = [ln.rstrip() for ln in out.splitlines() if ln.strip()]
-        lines = [ln for ln in lines if not self.is_ignored(ln)]
-
-        # Parse error counts from the output
+        # Parse error counts from the output, filtering blank/ignored lines
+        # in the same pass instead of materializing intermediate lists
         error_counts = {}
-        for ln in lines:
-            m = re.search(r"(\w+_errors?):\s*(\d+)", ln)
-            if m:
-                error_type = m.group(1)
-                count = int(m.group(2))
-                error_counts[error_type] = count
+        for ln in out.splitlines():
+            ln = ln.rstrip()
+            if not ln or self.is_ignored(ln):
+                continue
+            if "error" not in ln or ":" not in ln:
+                continue
+            key, _, val = ln.partition(":")
+            key = key.strip()
+            if not (key.endswith("_errors") or key.endswith("_error")):
+                continue
+            try:
+                error_counts[key] = int(val.strip())
+            except ValueError:
+                pass
 
         # Determine status based on error counts
         total_errors = sum(error_counts.values())
@@ -1,11 +1,13 @@
 import json
-import shutil
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
 from .base import HealthCheckModule, HealthCheckResult, IgnoreRules, Status
 
+_MARKER = {Status.OK: "✓", Status.WARN: "!", Status.CRITICAL: "✗"}
+
 
 @dataclass(frozen=True)
 class MountThreshold:
@@ -103,8 +105,12 @@ class DiskModule(HealthCheckModule):
         mount_statuses: List[Status] = []
 
         for cfg in self.mount_thresholds:
+            # os.statvfs directly: shutil.disk_usage is just a wrapper that
+            # builds a namedtuple around the same call. f_bavail mirrors its
+            # notion of 'free' (space available to unprivileged users), and
+            # statvfs also exposes inode counts should we ever warn on those.
             try:
-                usage = shutil.disk_usage(cfg.path)
+                st = os.statvfs(cfg.path)
             except FileNotFoundError:
                 mount_statuses.append(Status.WARN)
                 lines.append(f"{cfg.path}: not found (warn)")
@@ -118,13 +124,14 @@ class DiskModule(HealthCheckModule):
                 lines.append(f"{cfg.path}: error reading usage ({exc})")
                 continue
 
-            total = usage.total
+            total = st.f_blocks * st.f_frsize
             if total <= 0:
                 mount_statuses.append(Status.WARN)
                 lines.append(f"{cfg.path}: unable to determine size")
                 continue
 
-            used_percent = ((usage.total - usage.free) / usage.total) * 100
+            free = st.f_bavail * st.f_frsize
+            used_percent = ((total - free) / total) * 100
 
             if used_percent >= cfg.critical_percent:
                 status = Status.CRITICAL
@@ -135,15 +142,10 @@ class DiskModule(HealthCheckModule):
 
             mount_statuses.append(status)
 
-            free_gib = usage.free / (1024 ** 3)
-            total_gib = usage.total / (1024 ** 3)
-            marker = {
-                Status.OK: "✓",
-                Status.WARN: "!",
-                Status.CRITICAL: "✗",
-            }[status]
+            free_gib = free / (1024 ** 3)
+            total_gib = total / (1024 ** 3)
             lines.append(
-                f"[{marker}] {cfg.path}: {used_percent:.1f}% used ({free_gib:.1f}/{total_gib:.1f} GiB free) "
+                f"[{_MARKER[status]}] {cfg.path}: {used_percent:.1f}% used ({free_gib:.1f}/{total_gib:.1f} GiB free) "
                 f"(warn {cfg.warn_percent:.1f}%, crit {cfg.critical_percent:.1f}%)"
             )
 
@@ -1,6 +1,7 @@
+from collections import deque
 from typing import List, Optional, Tuple
 from .base import HealthCheckModule, IgnoreRules, Status, HealthCheckResult
-from .utils import run
+from .utils import StreamedRun
 
 
 class JournalModule(HealthCheckModule):
@@ -13,25 +14,37 @@ class JournalModule(HealthCheckModule):
     def check(self) -> HealthCheckResult:
         """Check journal health."""
         cmd = ["journalctl", "-b", "-p", "err..emerg", "--no-pager", "-o", "short-iso"]
-        code, out, err = run(cmd)
-        if code == 127:
+        stream = StreamedRun(cmd)
+        if stream.returncode == 127:
             return HealthCheckResult(
                 status=Status.WARN,
                 tooltipLines=["journalctl missing"],
             )
-        if code != 0 and not out.strip():
+
+        # Stream the journal instead of buffering it; on a long-running
+        # system the full error output can be many MB. Only the tail is
+        # ever shown, so a bounded deque keeps memory constant.
+        recent: deque = deque(maxlen=self.max_tooltip_lines)
+        count = 0
+        saw_output = False
+        for ln in stream:
+            if not ln.strip():
+                continue
+            saw_output = True
+            if self.is_ignored(ln):
+                continue
+            count += 1
+            recent.append(ln)
+        code = stream.returncode
+        err = stream.stderr
+
+        if code != 0 and not saw_output:
             note = (err.strip() or "cannot read journal").splitlines()[0] # TODO don't just use the first line only
             return HealthCheckResult(
                 status=Status.WARN,
                 tooltipLines=["Journal errors (err..emerg): (not readable)", f"  {note}", "", "Tip: add user to systemd-journal group, then re-login."],
             )
 
-        lines_all = [ln for ln in out.splitlines() if ln.strip()]
-        lines_filtered = [ln for ln in lines_all if not self.is_ignored(ln)]
-
-        count = len(lines_filtered)
-        recent = lines_filtered[-self.max_tooltip_lines:]
-
         if count == 0:
             return HealthCheckResult(
                 status=Status.OK,
@@ -43,8 +56,7 @@ class JournalModule(HealthCheckModule):
         if recent:
             details.append("")
             details.append("Most recent:")
-            for ln in recent:
-                details.append(f"  {ln}")
+            details.extend("  " + ln for ln in recent)
             if count > len(recent):
                 details.append(f"  … (+{count - len(recent)} more)")
 
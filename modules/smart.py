@@ -1,5 +1,8 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import chain
+from textwrap import indent
 from typing import List, Optional, Tuple
 
 from .base import HealthCheckModule, HealthCheckResult, IgnoreRules, Status
@@ -10,8 +13,19 @@ from .utils import format_command_error, run
 class SmartDevice:
     path: str
     device_type: Optional[str] = None
+    open_error: Optional[str] = None
 
 
+# Health-line verdict keywords, matched as token prefixes so e.g. "failed",
+# "failure" and "passed" are covered.
+_HEALTH_TOKEN_RE = re.compile(r"[a-z/]+")
+_CRIT_PREFIXES = ("fail", "fault", "corrupt")
+_WARN_PREFIXES = ("unknown", "n/a")
+_OK_PREFIXES = ("pass", "ok", "good")
+
+_MARKER = {Status.OK: "✓", Status.WARN: "!", Status.CRITICAL: "✗"}
+_PREFIX = {Status.OK: "info", Status.WARN: "warn", Status.CRITICAL: "crit"}
+
 SMARTCTL_EXIT_BITS: List[Tuple[int, Status, str]] = [
     (1, Status.WARN, "smartctl: command line did not parse"),
     (2, Status.WARN, "smartctl: failed to open device"),
@@ -29,11 +43,25 @@ def parse_scan_output(output: str) -> List[SmartDevice]:
 
     for raw in output.splitlines():
         line = raw.strip()
-        if not line or line.startswith("#"):
+        if not line:
             continue
 
+        # smartctl comments out the whole line for devices it couldn't open,
+        # e.g. '# /dev/sdb -d sat # /dev/sdb [SAT], ATA device open failed:
+        # Permission denied'. Keep those so check() can report them without
+        # spending a smartctl -a run; skip any other comment line.
+        commented_out = False
+        if line.startswith("#"):
+            if "open failed" not in line.lower():
+                continue
+            commented_out = True
+            line = line.lstrip("#").strip()
+
+        comment = ""
         if "#" in line:
-            line = line.split("#", 1)[0].strip()
+            line, _, comment = line.partition("#")
+            line = line.strip()
+            comment = comment.strip()
         if not line:
             continue
 
@@ -46,7 +74,12 @@ def parse_scan_output(output: str) -> List[SmartDevice]:
         if len(tokens) >= 3 and tokens[1] == "-d":
             device_type = tokens[2]
 
-        devices.append(SmartDevice(path=path, device_type=device_type))
+        open_error: Optional[str] = None
+        if "open failed" in comment.lower():
+            open_error = comment
+        elif commented_out:
+            open_error = "open failed"
+        devices.append(SmartDevice(path=path, device_type=device_type, open_error=open_error))
 
     return devices
 
@@ -78,14 +111,24 @@ class SmartModule(HealthCheckModule):
             lines.append("Make sure your sudo permissions are set per the README.md")
             return HealthCheckResult(status=Status.WARN, tooltipLines=lines)
 
-        results = [self._check_device(dev) for dev in devices]
+        # smartctl can take hundreds of ms per (spinning) disk; query devices
+        # concurrently. ex.map preserves order, keeping the tooltip deterministic.
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as ex:
+            results = list(ex.map(self._check_device, devices))
 
         return HealthCheckResult(
-            status=Status.worst([status for status, _ in results]),
+            status=Status.worst(status for status, _ in results),
             tooltipLines=list(chain.from_iterable(lines for _, lines in results)),
         )
 
     def _check_device(self, device: SmartDevice) -> Tuple[Status, List[str]]:
+        if device.open_error:
+            # --scan-open already told us the device can't be opened;
+            # don't spend another smartctl invocation confirming it.
+            return Status.WARN, [
+                f"[{_MARKER[Status.WARN]}] {device.path}: scan reported: {device.open_error}"
+            ]
+
         cmd = ["sudo", "smartctl", "-a", device.path]
         code, out, err = run(cmd)
         if code == 127:
@@ -99,24 +142,17 @@ class SmartModule(HealthCheckModule):
         status = self._status_from_exit_and_health(exit_messages, health_line)
         summary = self._summarize_health(health_line, status)
 
-        marker = {Status.OK: "✓", Status.WARN: "!", Status.CRITICAL: "✗"}[status]
-        lines = [f"[{marker}] {device.path}: {summary}"]
+        lines = [f"[{_MARKER[status]}] {device.path}: {summary}"]
 
         if exit_messages:
             for msg_status, msg in exit_messages:
-                prefix = {
-                    Status.OK: "info",
-                    Status.WARN: "warn",
-                    Status.CRITICAL: "crit",
-                }[msg_status]
-                lines.append(f"  - ({prefix}) {msg}")
+                lines.append(f"  - ({_PREFIX[msg_status]}) {msg}")
 
         if code != 0 and not exit_messages and (err.strip() or not out.strip()):
             lines.extend(format_command_error("sudo smartctl -a", code, out, err))
         elif err.strip() and code == 0:
             lines.append("  stderr:")
-            for ln in err.strip().splitlines():
-                lines.append(f"    {ln}")
+            lines.append(indent(err.strip(), "    "))
 
         return status, lines
 
@@ -136,15 +172,31 @@ class SmartModule(HealthCheckModule):
         statuses = [status for status, _ in exit_messages] or [Status.OK]
 
         if health_line:
-            summary = health_line.lower()
-            if any(keyword in summary for keyword in ["fail", "fault", "corrupt"]):
-                statuses.append(Status.CRITICAL)
-            elif any(keyword in summary for keyword in ["unknown", "n/a", "not supported"]):
-                statuses.append(Status.WARN)
-            elif any(keyword in summary for keyword in ["pass", "ok", "good"]):
-                statuses.append(Status.OK)
-            else:
-                statuses.append(Status.WARN)
+            # Tokenize once and classify in a single pass rather than
+            # scanning the line once per keyword group.
+            verdict = None
+            saw_warn = saw_ok = False
+            prev = ""
+            for token in _HEALTH_TOKEN_RE.findall(health_line.lower()):
+                if token.startswith(_CRIT_PREFIXES):
+                    verdict = Status.CRITICAL
+                    break
+                # "supported" is only a warning when negated ("not supported")
+                if token.startswith(_WARN_PREFIXES) or (
+                    prev == "not" and token.startswith("supported")
+                ):
+                    saw_warn = True
+                elif token.startswith(_OK_PREFIXES):
+                    saw_ok = True
+                prev = token
+            if verdict is None:
+                if saw_warn:
+                    verdict = Status.WARN
+                elif saw_ok:
+                    verdict = Status.OK
+                else:
+                    verdict = Status.WARN
+            statuses.append(verdict)
 
         return Status.worst(statuses)
 
@@ -1,3 +1,6 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Optional
 from .base import HealthCheckModule, IgnoreRules, Status, HealthCheckResult
 from .utils import run, format_command_error
@@ -41,36 +44,39 @@ class SystemdModule(HealthCheckModule):
     def _failed_units_result(self, user: bool) -> HealthCheckResult:
         """Return HealthCheckResult describing failed units."""
         label = " --user" if user else ""
-        cmd = ["systemctl"]
-        if user:
-            cmd.append("--user")
-        cmd += ["--failed", "--no-legend", "--plain"]
-        code, out, err = run(cmd)
+        base = ["systemctl", "--user"] if user else ["systemctl"]
 
+        # Prefer structured output: one json.loads instead of line splitting
+        # and field picking. systemctl without --output=json rejects the
+        # flag, in which case we fall back to the plain listing.
+        code, out, err = run(base + ["list-units", "--state=failed", "--output=json", "--no-pager"])
         if code == 127:
             return HealthCheckResult(
                 status=Status.WARN,
                 tooltipLines=[f"systemctl missing"],
             )
-        if code != 0:
-            return HealthCheckResult(
-                status=Status.WARN,
-                tooltipLines=format_command_error(f"systemctl{label} --failed", code, out, err),
-            )
 
-        units: List[str] = []
-        for line in out.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            unit = line.split()[0]
-            if not self.is_ignored(unit):
-                units.append(unit)
+        all_units: Optional[List[str]] = None
+        if code == 0:
+            try:
+                all_units = [entry["unit"] for entry in json.loads(out or "[]")]
+            except (ValueError, KeyError, TypeError):
+                all_units = None
+
+        if all_units is None:
+            code, out, err = run(base + ["--failed", "--no-legend", "--plain"])
+            if code != 0:
+                return HealthCheckResult(
+                    status=Status.WARN,
+                    tooltipLines=format_command_error(f"systemctl{label} --failed", code, out, err),
+                )
+            all_units = [line.split()[0] for line in out.splitlines() if line.strip()]
+
+        units = [u for u in all_units if not self.is_ignored(u)]
 
         if units:
             lines = [f"Failed units:"]
-            for u in units[:self.max_tooltip_units]:
-                lines.append(f"  • {u}")
+            lines.extend("  • " + u for u in units[:self.max_tooltip_units])
             if len(units) > self.max_tooltip_units:
                 lines.append(f"  … (+{len(units) - self.max_tooltip_units} more)")
             status = Status.CRITICAL
@@ -82,11 +88,17 @@ class SystemdModule(HealthCheckModule):
 
     def check(self) -> HealthCheckResult:
         """Check systemd health."""
-        results = {
-            "## System state": self._state_result(user=False),
-            "## User state": self._state_result(user=True),
-            "## Failed (system)": self._failed_units_result(user=False),
-            "## Failed (user)": self._failed_units_result(user=True),
+        # Four independent systemctl calls; run them concurrently so the
+        # module's latency is that of the slowest one.
+        tasks = {
+            "## System state": partial(self._state_result, user=False),
+            "## User state": partial(self._state_result, user=True),
+            "## Failed (system)": partial(self._failed_units_result, user=False),
+            "## Failed (user)": partial(self._failed_units_result, user=True),
         }
 
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            futures = {name: ex.submit(task) for name, task in tasks.items()}
+            results = {name: f.result() for name, f in futures.items()}
+
         return HealthCheckResult.merge(results)
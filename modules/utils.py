@@ -1,19 +1,76 @@
 import subprocess
 import re
+import threading
 from pathlib import Path
-from typing import List, Tuple, Dict
+from textwrap import indent
+from typing import Iterator, List, Tuple, Dict
 from .base import IgnoreRules
 
 
-def run(cmd: List[str]) -> Tuple[int, str, str]:
-    """Run a command and return (returncode, stdout, stderr)."""
+def run(cmd: List[str], want_stderr: bool = True) -> Tuple[int, str, str]:
+    """Run a command and return (returncode, stdout, stderr).
+
+    Pass want_stderr=False when the caller never reads stderr: it goes to
+    /dev/null instead of a pipe (two syscalls and a read saved) and the
+    returned stderr is always "".
+    """
     try:
-        p = subprocess.run(cmd, text=True, capture_output=True)
-        return p.returncode, p.stdout, p.stderr
+        # close_fds=False: we hold no sensitive FDs, and it lets CPython use
+        # the posix_spawn fast path instead of closing every inherited FD
+        # in the child before exec.
+        p = subprocess.run(
+            cmd,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
+            close_fds=False,
+        )
+        return p.returncode, p.stdout, p.stderr or ""
     except FileNotFoundError:
         return 127, "", f"Command not found: {cmd[0]}"
 
 
+class StreamedRun:
+    """Run a command, streaming stdout line-by-line instead of buffering it all.
+
+    Iterate over the instance to consume stdout lines (trailing newlines
+    stripped) as the command produces them; once iteration completes,
+    `returncode` and `stderr` are populated. If the command is not found,
+    iteration yields nothing and `returncode` is 127 immediately.
+    """
+
+    def __init__(self, cmd: List[str]):
+        self.returncode = None
+        self.stderr = ""
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            self._proc = None
+            self.returncode = 127
+            self.stderr = f"Command not found: {cmd[0]}"
+
+    def __iter__(self) -> Iterator[str]:
+        if self._proc is None:
+            return
+        # Drain stderr on a side thread while we consume stdout (as
+        # subprocess.run does); reading it only afterwards deadlocks if the
+        # child fills the stderr pipe buffer while stdout is still open.
+        def _drain_stderr() -> None:
+            self.stderr = self._proc.stderr.read()
+
+        drainer = threading.Thread(target=_drain_stderr)
+        drainer.start()
+        for ln in self._proc.stdout:
+            yield ln.rstrip("\n")
+        drainer.join()
+        self._proc.stdout.close()
+        self._proc.stderr.close()
+        self.returncode = self._proc.wait()
+
+
 def format_command_error(cmd_name: str, code: int, stdout: str, stderr: str) -> List[str]:
     """Format a command error with exit code and output.
     
@@ -28,15 +85,15 @@ def format_command_error(cmd_name: str, code: int, stdout: str, stderr: str) ->
     """
     lines = [f"{cmd_name} failed with code {code}"]
     
+    # textwrap.indent prefixes the whole block in one pass; the multi-line
+    # entries are fine since tooltip lines are ultimately "\n".join'd.
     if stderr.strip():
         lines.append("stderr:")
-        for ln in stderr.strip().splitlines():
-            lines.append(f"  {ln}")
-    
+        lines.append(indent(stderr.strip(), "  "))
+
     if stdout.strip():
         lines.append("stdout:")
-        for ln in stdout.strip().splitlines():
-            lines.append(f"  {ln}")
+        lines.append(indent(stdout.strip(), "  "))
     
     return lines
 
@@ -69,13 +126,12 @@ def parse_ignore_file(path: str, known_modules: List[str]) -> Dict[str, IgnoreRu
         if not line or line.startswith("#"):
             continue
 
-        m = re.match(r"^(\w+):(.+)$", line)
-        if not m:
+        # 'module:<regex>' split via partition; no regex needed for this
+        module, sep, pattern = line.partition(":")
+        pattern = pattern.strip()
+        if not sep or not pattern or not module or not module.replace("_", "").isalnum():
             raise ValueError(f"Line {line_num}: Invalid format '{line}'. Expected 'module:<regex>'")
-        
-        module = m.group(1).strip()
-        pattern = m.group(2).strip()
-        
+
         if module not in known_modules:
             raise ValueError(f"Line {line_num}: Unknown module '{module}'. Known modules: {', '.join(known_modules)}")
         